@@ -1,23 +1,36 @@
 import argparse
 from sync import sync
-from export_orders import export_orders
-from upload_images import upload_images
+from export_orders import export_orders, export_targets
+from upload_images import upload_images, prune_images
 from backup import backup
+from utils.firestore_utils import enable_collection_cache, cache_report
 
 def main():
     parser = argparse.ArgumentParser(description="Run various commands.")
-    parser.add_argument("command", choices=["sync", "export", "upload_images", "backup"], help="The command to run")
+    parser.add_argument("commands", nargs="+", choices=["sync", "export", "upload_images", "prune_images", "backup"], help="The commands to run, in order, in a single process")
+    parser.add_argument("--target", choices=list(export_targets), default="google_sheet", help="Where the export command writes its output")
 
     args = parser.parse_args()
 
-    if args.command == "sync":
-        sync()
-    elif args.command == "export":
-        export_orders()
-    elif args.command == "upload_images":
-        upload_images()
-    elif args.command == "backup":
-        backup()
+    # Later commands reuse the collections earlier ones already read or wrote
+    if len(args.commands) > 1:
+        enable_collection_cache()
+
+    for command in args.commands:
+        if command == "sync":
+            sync()
+        elif command == "export":
+            url = export_orders(args.target)
+            print(f"Export created: {url}")
+        elif command == "upload_images":
+            upload_images()
+        elif command == "prune_images":
+            prune_images()
+        elif command == "backup":
+            backup()
+
+    if len(args.commands) > 1:
+        print(cache_report())
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
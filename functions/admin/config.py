@@ -1,4 +1,5 @@
 import os
+import tempfile
 from google.cloud import storage as gcs_storage
 from firebase_admin import credentials
 import firebase_admin
@@ -11,6 +12,9 @@ firebase_storage_bucket = "shomron-tights.firebasestorage.app"
 firestore_project_id = "shomron-tights"
 images_path = "/Users/eyalazran/Downloads/app_images/test"
 base_frontend_url = "https://shomron-tights.web.app"
+images_bucket_name = "shomron-tights-images"
+images_manifest_file_name = "manifest.json"
+local_export_path = os.path.join(tempfile.gettempdir(), "shomron-tights-exports")
 
 if os.path.exists(service_account_file):
     cloud_storage_client = gcs_storage.Client.from_service_account_json(
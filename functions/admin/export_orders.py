@@ -1,11 +1,18 @@
 from datetime import datetime
 from sync import product_short_description
 from utils.google_sheet_utils import create_google_sheet_with_permissions
+from utils.local_file_utils import create_local_xlsx_workbook, create_local_csv_files
 from utils.firestore_utils import read_firestore_collection
 from config import base_frontend_url
 import pandas as pd
 import numpy as np
 
+export_targets = {
+    "google_sheet": create_google_sheet_with_permissions,
+    "xlsx": create_local_xlsx_workbook,
+    "csv": create_local_csv_files,
+}
+
 
 def current_sale():
     sales = read_firestore_collection("sales")
@@ -39,7 +46,10 @@ def normalize_df(df):
     df.fillna(0, inplace=True)
     df = df.round(2)
 
-def export_orders():
+def export_orders(target="google_sheet"):
+    if target not in export_targets:
+        raise ValueError(f"Unknown export target: {target}")
+
     orders = read_firestore_collection("orders")
     products = read_firestore_collection("products")    
     products_df = pd.DataFrame(products)
@@ -181,8 +191,6 @@ def export_orders():
         "כללי": general_df
     }
 
-    # Create the Google Sheet and set permissions
-    spreadsheet = create_google_sheet_with_permissions(
-        sheet_title, gmail_accounts, tabs_data
-    )
+    # Create the Google Sheet (or local file) and set permissions
+    spreadsheet = export_targets[target](sheet_title, gmail_accounts, tabs_data)
     return spreadsheet.url
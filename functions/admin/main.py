@@ -1,8 +1,9 @@
 from firebase_functions import https_fn
 from utils.jwt_utils import verify_id_token_and_email
+import os
 import flask
 from flask_cors import CORS
-from export_orders import export_orders, allowed_admins
+from export_orders import export_orders, allowed_admins, export_targets
 from sync import sync
 
 app = flask.Flask(__name__)
@@ -41,13 +42,28 @@ def sync_resolver():
 @app.get("/export")
 def export_resolver():
     try:
-        url = export_orders()
+        target = flask.request.args.get("target", "google_sheet")
+        if target not in export_targets:
+            return flask.Response(status=400, response=f"Unknown export target: {target}")
+        url = export_orders(target)
+        if target != "google_sheet":
+            return send_local_file(url)
         return flask.Response(status=201, response=url)
     except Exception as e:
         print(str(e))
         return https_fn.Response(str(e), status=500)
 
 
+def send_local_file(file_path):
+    # /tmp counts against the instance memory, so don't leave exports behind.
+    # The open handle keeps the data readable while the response streams it.
+    f = open(file_path, "rb")
+    os.remove(file_path)
+    return flask.send_file(
+        f, as_attachment=True, download_name=os.path.basename(file_path)
+    )
+
+
 @https_fn.on_request(
     timeout_sec=300,
     memory=512,
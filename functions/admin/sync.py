@@ -3,7 +3,8 @@ from utils.firestore_utils import (
     delete_collection,
     write_df_to_firestore,
 )
-from config import input_google_sheet_id
+from utils.cloud_storage_utils import read_json_from_cloud_storage, public_url
+from config import input_google_sheet_id, images_bucket_name, images_manifest_file_name
 
 
 def sync():
@@ -49,6 +50,7 @@ def save_dfs_to_firestore(dataframes):
 
             if tab_name == "products":
                 df["short_description"] = df.apply(product_short_description, axis=1)
+                attach_product_images(df)
 
             write_df_to_firestore(df, collection_name, "id")
         else:
@@ -57,6 +59,19 @@ def save_dfs_to_firestore(dataframes):
         print(f"DataFrame for tab: {tab_name} saved successfully")
     print("DataFrames saved to Firestore successfully")
 
+def attach_product_images(df):
+    if "image" not in df.columns:
+        print("Skipping product images: no image column")
+        return
+    manifest = read_json_from_cloud_storage(images_bucket_name, images_manifest_file_name) or {}
+    df["images"] = df["image"].map(
+        lambda image: [
+            {**variant, "url": public_url(images_bucket_name, variant["path"])}
+            for variant in manifest.get(str(image), [])
+        ]
+    )
+    print(f"Attached images to {sum(df['images'].map(bool))} products")
+
 def product_short_description(df):
     kind = df.get("kind")
     name = df.get("name")
@@ -1,18 +1,49 @@
+import os
 from utils.cloud_storage_utils import (
     create_gcs_bucket,
-    delete_gcs_bucket,
+    delete_blobs_not_in,
+    read_json_from_cloud_storage,
     upload_folder_content_to_cloud_storage,
+    upload_json_to_cloud_storage,
 )
 from utils.image_utils import downscale_images
-from utils.filesystem_utils import delete_local_folder_and_content
+from utils.filesystem_utils import delete_local_folder_and_content, write_json_file
+from config import images_bucket_name, images_manifest_file_name
 
 
 def upload_images():
-    images_path_input = "~/Downloads/tights-shomron-images"
+    images_path_input = os.path.expanduser("~/Downloads/tights-shomron-images")
     images_path_output = images_path_input + "uploaded"
     delete_local_folder_and_content(images_path_output)
-    downscale_images(images_path_input, images_path_output)
-    bucket_name = "shomron-tights-images"
-    delete_gcs_bucket(bucket_name)
-    create_gcs_bucket(bucket_name)
-    upload_folder_content_to_cloud_storage(bucket_name, images_path_output)
+    manifest = downscale_images(images_path_input, images_path_output)
+    # An empty manifest would leave sync without images and let prune_images empty the bucket
+    if not manifest:
+        raise Exception(f"No images found in {images_path_input}, nothing to upload")
+    create_gcs_bucket(images_bucket_name)
+    # Variant names change with their content, so old and new variants live side by side
+    # and never need revalidation
+    upload_folder_content_to_cloud_storage(
+        images_bucket_name,
+        images_path_output,
+        cache_control="public, max-age=31536000, immutable",
+        skip_existing=True,
+    )
+    # The manifest keeps a stable name and must always be revalidated
+    write_json_file(
+        os.path.join(images_path_output, images_manifest_file_name), manifest
+    )
+    upload_json_to_cloud_storage(
+        images_bucket_name, images_manifest_file_name, manifest
+    )
+
+
+def prune_images():
+    # Run after sync, once products no longer point at variants missing from the manifest
+    manifest = read_json_from_cloud_storage(images_bucket_name, images_manifest_file_name)
+    if manifest is None:
+        print("No manifest found, nothing to prune")
+        return
+    blob_names_to_keep = {images_manifest_file_name}
+    for variants in manifest.values():
+        blob_names_to_keep.update(variant["path"] for variant in variants)
+    delete_blobs_not_in(images_bucket_name, blob_names_to_keep)
@@ -1,5 +1,7 @@
 from config import cloud_storage_client
+import json
 import os
+from urllib.parse import quote
 
 
 def delete_gcs_bucket(bucket_name):
@@ -52,7 +54,9 @@ def create_gcs_bucket(bucket_name):
     print(f"Replication disabled for bucket {new_bucket.name}.")
 
 
-def upload_folder_content_to_cloud_storage(bucket_name, folder_path):
+def upload_folder_content_to_cloud_storage(
+    bucket_name, folder_path, cache_control="public, max-age=3600", skip_existing=False
+):
     bucket = cloud_storage_client.bucket(bucket_name)
 
     for root, _, files in os.walk(folder_path):
@@ -61,10 +65,43 @@ def upload_folder_content_to_cloud_storage(bucket_name, folder_path):
             # Preserve the folder structure by using the relative path
             blob_name = os.path.relpath(file_path, folder_path)
             blob = bucket.blob(blob_name)
+            if skip_existing and blob.exists():
+                print(f"File {blob_name} already exists, skipping.")
+                continue
 
-            # Set cache control to one hour
-            blob.cache_control = "public, max-age=3600"
+            blob.cache_control = cache_control
 
             # Upload the file to the bucket
             blob.upload_from_filename(file_path)
             print(f"File {file_path} uploaded to {blob_name}.")
+
+
+def upload_json_to_cloud_storage(bucket_name, blob_name, data, cache_control="no-cache"):
+    bucket = cloud_storage_client.bucket(bucket_name)
+    blob = bucket.blob(blob_name)
+    blob.cache_control = cache_control
+    blob.upload_from_string(
+        json.dumps(data, ensure_ascii=False), content_type="application/json"
+    )
+    print(f"JSON uploaded to {blob_name}.")
+
+
+def read_json_from_cloud_storage(bucket_name, blob_name):
+    bucket = cloud_storage_client.bucket(bucket_name)
+    blob = bucket.blob(blob_name)
+    if not bucket.exists() or not blob.exists():
+        print(f"Blob {blob_name} does not exist in bucket {bucket_name}.")
+        return None
+    return json.loads(blob.download_as_text())
+
+
+def public_url(bucket_name, blob_name):
+    return f"https://storage.googleapis.com/{bucket_name}/{quote(blob_name)}"
+
+
+def delete_blobs_not_in(bucket_name, blob_names_to_keep):
+    bucket = cloud_storage_client.bucket(bucket_name)
+    for blob in cloud_storage_client.list_blobs(bucket_name):
+        if blob.name not in blob_names_to_keep:
+            bucket.delete_blob(blob.name)
+            print(f"Blob {blob.name} deleted.")
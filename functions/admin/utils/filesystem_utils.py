@@ -1,3 +1,4 @@
+import json
 import os
 import shutil
 
@@ -8,3 +9,9 @@ def delete_local_folder_and_content(folder_path):
         print(f"Folder {folder_path} and all its contents have been deleted.")
     else:
         print(f"Folder {folder_path} does not exist.")
+
+
+def write_json_file(file_path, data):
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    print(f"File {file_path} written.")
@@ -1,5 +1,25 @@
+import copy
 from config import firestore_database_client
 
+# Collections read or written in this process, only used when enabled (multi-command CLI runs)
+collection_cache = {}
+collection_cache_stats = {"hits": 0, "misses": 0}
+collection_cache_enabled = False
+
+
+def enable_collection_cache():
+    global collection_cache_enabled
+    collection_cache_enabled = True
+
+
+def cache_report():
+    return f"collection cache hits: {collection_cache_stats['hits']}, misses: {collection_cache_stats['misses']}"
+
+
+def to_firestore_value(value):
+    # Firestore hands back plain python values, not numpy scalars
+    return value.item() if hasattr(value, "item") else value
+
 
 def delete_collection(collection_name, batch_size=100):
     print(f"Deleting collection: {collection_name}")
@@ -21,6 +41,8 @@ def delete_collection(collection_name, batch_size=100):
             break
 
     print(f"Collection '{collection_name}' deleted successfully")
+    if collection_cache_enabled:
+        collection_cache[collection_name] = {}
 
 
 def write_df_to_firestore(df, collection_name, id_column=None):
@@ -36,9 +58,20 @@ def write_df_to_firestore(df, collection_name, id_column=None):
             doc_id = str(index)
         doc_ref = collection_ref.document(doc_id)
         doc_ref.set(row.to_dict())
+        if collection_name in collection_cache:
+            doc_dict = {key: to_firestore_value(value) for key, value in row.to_dict().items()}
+            doc_dict["_id"] = doc_id
+            collection_cache[collection_name][doc_id] = doc_dict
 
 
 def read_firestore_collection(collection_name):
+    if collection_name in collection_cache:
+        collection_cache_stats["hits"] += 1
+        print(f"Reading cached collection: {collection_name}")
+        # Firestore streams documents ordered by id
+        docs = collection_cache[collection_name]
+        return [copy.deepcopy(docs[doc_id]) for doc_id in sorted(docs)]
+
     print(f"Reading Firestore collection: {collection_name}")
     try:
         collection_ref = firestore_database_client.collection(collection_name)
@@ -48,6 +81,11 @@ def read_firestore_collection(collection_name):
             doc_dict = doc.to_dict()
             doc_dict["_id"] = doc.id  # Include the document ID in the dictionary
             documents.append(doc_dict)
+        if collection_cache_enabled:
+            collection_cache_stats["misses"] += 1
+            collection_cache[collection_name] = {
+                doc["_id"]: copy.deepcopy(doc) for doc in documents
+            }
         return documents
     except Exception as e:
         print(f"Error reading Firestore collection: {e}")
@@ -1,21 +1,75 @@
+import hashlib
+import io
 import os
 from PIL import Image
 
+variant_formats = {
+    "jpg": {"format": "JPEG", "optimize": True, "quality": 85},
+    "webp": {"format": "WEBP", "quality": 80, "method": 6},
+}
 
-def downscale_images(input_path, output_path, mobile_size=(720, 1280)):
+
+def downscale_images(input_path, output_path, widths=(360, 720, 1080)):
+    manifest = {}
     for root, _, files in os.walk(input_path):
         for file in files:
             if file.lower().endswith(("png", "jpg", "jpeg", "gif", "bmp")):
                 file_path = os.path.join(root, file)
                 with Image.open(file_path) as img:
                     relative_path = os.path.relpath(root, input_path)
-
-                    # Downscale for mobile
-                    img_mobile = img.copy()
-                    img_mobile.thumbnail(mobile_size, Image.Resampling.LANCZOS)
-                    mobile_output_dir = os.path.join(output_path, relative_path)
-                    os.makedirs(mobile_output_dir, exist_ok=True)
-                    mobile_output_path = os.path.join(
-                        mobile_output_dir, f"mobile_{file}"
+                    output_dir = os.path.join(output_path, relative_path)
+                    os.makedirs(output_dir, exist_ok=True)
+                    source_name = os.path.normpath(os.path.join(relative_path, file))
+                    # Keep the alpha channel for formats that support it
+                    has_alpha = img.mode in ("RGBA", "LA", "PA") or "transparency" in img.info
+                    img = img.convert("RGBA" if has_alpha else "RGB")
+                    manifest[source_name.replace(os.sep, "/")] = save_image_variants(
+                        img, output_path, output_dir, file, widths
                     )
-                    img_mobile.save(mobile_output_path, optimize=True, quality=85)
+    return manifest
+
+
+def save_image_variants(img, output_path, output_dir, file, widths):
+    base_name = os.path.splitext(file)[0]
+    variants = []
+    saved_sizes = set()
+    for width in widths:
+        # Thumbnail keeps the aspect ratio and never upscales
+        img_variant = img.copy()
+        img_variant.thumbnail((width, img.height), Image.Resampling.LANCZOS)
+        if img_variant.size in saved_sizes:
+            continue
+        saved_sizes.add(img_variant.size)
+
+        for extension, save_options in variant_formats.items():
+            img_encoded = img_variant
+            if save_options["format"] == "JPEG" and img_variant.mode == "RGBA":
+                img_encoded = flatten_alpha(img_variant)
+            buffer = io.BytesIO()
+            img_encoded.save(buffer, **save_options)
+            content = buffer.getvalue()
+
+            # Name by content hash so the file can be cached forever
+            content_hash = hashlib.sha256(content).hexdigest()[:16]
+            variant_file = f"{base_name}-{img_variant.width}w.{content_hash}.{extension}"
+            variant_path = os.path.join(output_dir, variant_file)
+            with open(variant_path, "wb") as f:
+                f.write(content)
+
+            variants.append(
+                {
+                    "path": os.path.relpath(variant_path, output_path).replace(os.sep, "/"),
+                    "width": img_variant.width,
+                    "height": img_variant.height,
+                    "format": extension,
+                }
+            )
+    print(f"Created {len(variants)} variants for {file}")
+    return variants
+
+
+def flatten_alpha(img, background_color="white"):
+    # JPEG has no alpha channel, draw transparent areas over a plain background
+    background = Image.new("RGB", img.size, background_color)
+    background.paste(img, mask=img.getchannel("A"))
+    return background
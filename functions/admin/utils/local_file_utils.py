@@ -0,0 +1,58 @@
+import csv
+import os
+import shutil
+from collections import namedtuple
+from openpyxl import Workbook
+from config import local_export_path
+from utils.filesystem_utils import delete_local_folder_and_content
+
+LocalExport = namedtuple("LocalExport", ["url"])
+
+
+def local_export_file_name(sheet_title):
+    # Sheet titles contain a timestamp, keep the file name portable
+    return sheet_title.replace(":", "-").replace(" ", "_")
+
+
+def create_local_xlsx_workbook(sheet_title, gmail_accounts, tabs_data):
+    os.makedirs(local_export_path, exist_ok=True)
+    file_path = os.path.join(
+        local_export_path, local_export_file_name(sheet_title) + ".xlsx"
+    )
+
+    # Write only workbooks stream rows to disk instead of keeping every cell in memory
+    workbook = Workbook(write_only=True)
+    for tab_name, df in tabs_data.items():
+        worksheet = workbook.create_sheet(title=tab_name)
+        worksheet.append(df.columns.values.tolist())
+        for row in df.itertuples(index=False, name=None):
+            worksheet.append(row)
+        print(f"Added tab: {tab_name}")
+    workbook.save(file_path)
+    print(f"Created local workbook: {file_path}")
+
+    # Local files have no sharing, the caller hands the file over
+    print(f"Skipping permissions for: {gmail_accounts}")
+    return LocalExport(url=file_path)
+
+
+def create_local_csv_files(sheet_title, gmail_accounts, tabs_data):
+    folder_path = os.path.join(local_export_path, local_export_file_name(sheet_title))
+    os.makedirs(folder_path, exist_ok=True)
+
+    for tab_name, df in tabs_data.items():
+        file_path = os.path.join(folder_path, f"{tab_name}.csv")
+        # utf-8-sig so Excel opens the hebrew headers correctly
+        with open(file_path, "w", newline="", encoding="utf-8-sig") as csv_file:
+            writer = csv.writer(csv_file)
+            writer.writerow(df.columns.values.tolist())
+            writer.writerows(df.itertuples(index=False, name=None))
+        print(f"Added tab: {tab_name}")
+
+    # Bundle the tabs so the folder can be returned as a single file
+    archive_path = shutil.make_archive(folder_path, "zip", folder_path)
+    print(f"Created local csv archive: {archive_path}")
+    delete_local_folder_and_content(folder_path)
+
+    print(f"Skipping permissions for: {gmail_accounts}")
+    return LocalExport(url=archive_path)